@@ -0,0 +1,30 @@
+import joblib
+from model_fingerprint import FINGERPRINT_KEY, file_sha256
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+MODEL_PATH = 'polymer_composite_model.pkl'
+ONNX_MODEL_PATH = 'polymer_composite_model.onnx'
+
+def export_onnx():
+    """Convert the trained multi-output model to ONNX for ONNX Runtime inference"""
+    model_data = joblib.load(MODEL_PATH)
+    n_features = len(model_data['feature_names'])
+    
+    onnx_model = convert_sklearn(
+        model_data['model'],
+        initial_types=[('X', FloatTensorType([None, n_features]))]
+    )
+    
+    # Record the source pickle so the app can ignore a stale export
+    fingerprint = onnx_model.metadata_props.add()
+    fingerprint.key = FINGERPRINT_KEY
+    fingerprint.value = file_sha256(MODEL_PATH)
+    
+    with open(ONNX_MODEL_PATH, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    
+    print(f"Exported {MODEL_PATH} to {ONNX_MODEL_PATH}")
+
+if __name__ == "__main__":
+    export_onnx()
@@ -0,0 +1,13 @@
+import hashlib
+
+# Metadata key / file name recording which pickle an exported model was built from
+FINGERPRINT_KEY = 'source_model_sha256'
+LIGHTGBM_FINGERPRINT_FILE = 'source_model_sha256.txt'
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, used to tie exported models to their source pickle"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
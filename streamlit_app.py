@@ -2,14 +2,30 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import joblib
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import os
 import warnings
+from model_fingerprint import FINGERPRINT_KEY, LIGHTGBM_FINGERPRINT_FILE, file_sha256
 warnings.filterwarnings('ignore')
 
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+try:
+    import lightgbm as lgb
+except ImportError:
+    lgb = None
+
+# The retrained LightGBM boosters are a different model, so they are only used on request
+USE_LIGHTGBM = os.environ.get('POLYMER_USE_LIGHTGBM', '').lower() in ('1', 'true', 'yes')
+
+BACKEND_LABELS = {
+    'lightgbm': 'LightGBM Gradient Boosting (one booster per property)',
+    'onnx': 'Multi-Output Random Forest Regressor (ONNX Runtime)',
+    'sklearn': 'Multi-Output Random Forest Regressor (scikit-learn)',
+}
+
 # Configure page
 st.set_page_config(
     page_title="AI-Powered Polymer Composite Properties Predictor",
@@ -19,7 +35,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
 .main-header {
     font-size: 3rem;
@@ -58,7 +74,54 @@ st.markdown("""
     box-shadow: 0 2px 4px rgba(0,0,0,0.1);
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Supported materials, shared by the predictor inputs and the About page
+POLYMER_MATRICES = ('Epoxy', 'Polyester', 'Vinyl Ester', 'Phenolic', 'Polyurethane')
+FILLER_TYPES = ('Bovine Bone Particles', 'Hydroxyapatite', 'Bamboo Fibers',
+                'Wood Flour', 'Rice Husk', 'Coconut Coir', 'Jute Fibers',
+                'Flax Fibers', 'Hemp Fibers', 'Chitosan Particles')
+
+SUPPORTED_MATERIALS_MD = (
+    "### 🧪 Supported Materials\n\n"
+    "**Polymer Matrices:**\n" + "".join(f"- {m}\n" for m in POLYMER_MATRICES) +
+    "\n**Natural Biogenic Fillers:**\n" + "".join(f"- {f}\n" for f in FILLER_TYPES)
+)
+
+# Gauge specs: (title, target, axis max, bar color, (step 1 end, step 2 end), threshold)
+MECHANICAL_GAUGES = (
+    ("Tensile Strength", 'Tensile_Strength_MPa', 200, "#1f77b4", (50, 100), 150),
+    ("Flexural Strength", 'Flexural_Strength_MPa', 250, "#ff7f0e", (75, 150), 200),
+    ("Impact Strength", 'Impact_Strength_J_m', 50, "#2ca02c", (15, 30), 40),
+)
+
+ELECTRICAL_GAUGES = (
+    ("Dielectric Constant", 'Dielectric_Constant', 10, "#d62728", (4, 6), 8),
+    ("Dielectric Strength", 'Dielectric_Strength_kV_mm', 60, "#9467bd", (20, 40), 50),
+)
+
+# Results summary rows: (property, target, value format, unit)
+RESULT_ROWS = (
+    ('Tensile Strength', 'Tensile_Strength_MPa', '.2f', 'MPa'),
+    ('Flexural Strength', 'Flexural_Strength_MPa', '.2f', 'MPa'),
+    ('Impact Strength', 'Impact_Strength_J_m', '.2f', 'J/m'),
+    ('Thermal Conductivity', 'Thermal_Conductivity_W_mK', '.3f', 'W/m·K'),
+    ('Glass Transition Temperature', 'Glass_Transition_Temp_C', '.1f', '°C'),
+    ('Thermal Expansion', 'Thermal_Expansion_ppm_C', '.1f', 'ppm/°C'),
+    ('Electrical Resistivity', 'Electrical_Resistivity_Ohm_m', '.2e', 'Ω·m'),
+    ('Dielectric Constant', 'Dielectric_Constant', '.2f', '-'),
+    ('Dielectric Strength', 'Dielectric_Strength_kV_mm', '.2f', 'kV/mm'),
+)
+
+# Readable "Name (unit)" labels for the raw target names
+TARGET_LABELS = {
+    key: name if unit == '-' else f"{name} ({unit})"
+    for name, key, _, unit in RESULT_ROWS
+}
+
+def inject_css():
+    """Inject the custom CSS in a single markdown element"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 def add_logo():
     """Add company logo to the top-left corner"""
@@ -76,11 +139,176 @@ def add_logo():
     with col3:
         st.empty()
 
+@st.cache_resource
+def _load_model_bundle():
+    """Load the trained model and preprocessors once per process"""
+    return joblib.load('polymer_composite_model.pkl')
+
+@st.cache_resource
+def _model_fingerprint():
+    """SHA-256 of the pickle, matched against the one recorded in exported models"""
+    return file_sha256('polymer_composite_model.pkl')
+
+@st.cache_resource
+def _load_onnx_session():
+    """Create an ONNX Runtime session for the exported model, if available"""
+    if ort is None or not os.path.exists('polymer_composite_model.onnx'):
+        return None
+    
+    try:
+        session = ort.InferenceSession('polymer_composite_model.onnx', providers=['CPUExecutionProvider'])
+    except Exception as e:
+        st.warning(f"Could not load the ONNX model, using scikit-learn instead: {str(e)}")
+        return None
+    
+    if session.get_modelmeta().custom_metadata_map.get(FINGERPRINT_KEY) != _model_fingerprint():
+        st.warning("polymer_composite_model.onnx was exported from a different model; "
+                   "re-run export_onnx.py. Using scikit-learn instead.")
+        return None
+    return session
+
+@st.cache_resource
+def _load_lightgbm_boosters():
+    """Load the per-target LightGBM boosters, if they have been trained"""
+    if lgb is None:
+        return None
+    
+    target_names = _load_model_bundle()['target_names']
+    paths = [os.path.join('lightgbm_models', f'{target}.txt') for target in target_names]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    
+    try:
+        with open(os.path.join('lightgbm_models', LIGHTGBM_FINGERPRINT_FILE)) as f:
+            fingerprint = f.read().strip()
+        boosters = [lgb.Booster(model_file=path) for path in paths]
+    except Exception as e:
+        st.warning(f"Could not load the LightGBM boosters, using the Random Forest instead: {str(e)}")
+        return None
+    
+    if fingerprint != _model_fingerprint():
+        st.warning("The LightGBM boosters were trained from a different model; "
+                   "re-run train_lightgbm.py. Using the Random Forest instead.")
+        return None
+    return boosters
+
+@st.cache_resource
+def _active_backend():
+    """Name of the inference backend in use: 'lightgbm', 'onnx' or 'sklearn'"""
+    if USE_LIGHTGBM and _load_lightgbm_boosters() is not None:
+        return 'lightgbm'
+    if _load_onnx_session() is not None:
+        return 'onnx'
+    return 'sklearn'
+
+@st.cache_resource
+def _load_predict_fn():
+    """Prediction function for the active backend"""
+    backend = _active_backend()
+    
+    if backend == 'lightgbm':
+        boosters = _load_lightgbm_boosters()
+        return lambda X: np.column_stack([booster.predict(X, num_threads=1) for booster in boosters])
+    
+    if backend == 'onnx':
+        session = _load_onnx_session()
+        return lambda X: session.run(None, {'X': X})[0]
+    
+    return _load_model_bundle()['model'].predict
+
+@st.cache_resource
+def _load_encoder_maps():
+    """Build class-to-code lookups for the categorical features"""
+    model_data = _load_model_bundle()
+    return {
+        feature: {cls: code for code, cls in enumerate(encoder.classes_)}
+        for feature, encoder in model_data['label_encoders'].items()
+    }
+
+@st.cache_resource
+def _resistivity_index():
+    """Column index of the log-scaled electrical resistivity target"""
+    return _load_model_bundle()['target_names'].index('Electrical_Resistivity_Ohm_m')
+
+@st.cache_resource
+def _scaler_params():
+    """Fitted scaler mean and scale, kept in float64"""
+    scaler = _load_model_bundle()['scaler']
+    return scaler.mean_, scaler.scale_
+
+def _encode_row(input_tuple):
+    """Encode raw input parameters into a single float64 NumPy row"""
+    encoder_maps = _load_encoder_maps()
+    polymer_matrix, filler_type, *numerical = input_tuple
+    
+    return np.array([[
+        encoder_maps['Polymer_Matrix'][polymer_matrix],
+        encoder_maps['Filler_Type'][filler_type],
+        *numerical
+    ]], dtype=np.float64)
+
+def _predict_rows(rows):
+    """Scale encoded rows and predict all target properties in one batch"""
+    # Scale in float64 like StandardScaler.transform; scaling in float32 moves
+    # category codes across split thresholds. Cast once afterwards for the backends.
+    mean, scale = _scaler_params()
+    input_scaled = ((rows - mean) / scale).astype(np.float32)
+    
+    # Make prediction with the selected backend
+    predictions = _load_predict_fn()(input_scaled)
+    
+    # Convert electrical resistivity back from log scale, in place
+    resist = predictions[:, _resistivity_index()]
+    np.power(10.0, resist, out=resist)
+    
+    return predictions
+
+@st.cache_data(max_entries=512)
+def _cached_predict(input_tuple):
+    """Predict all target properties, memoized on the raw input parameters"""
+    predictions = _predict_rows(_encode_row(input_tuple))
+    
+    # Read the single output row by target name
+    return dict(zip(_load_model_bundle()['target_names'], predictions[0].tolist()))
+
+@st.cache_data(max_entries=64)
+def _cached_sweep(frozen_inputs, n_points=200):
+    """Predict all target properties across the full filler ratio range in one batch"""
+    feature_names = _load_model_bundle()['feature_names']
+    ratios = np.linspace(0.0, 50.0, n_points)
+    
+    # The key omits the filler/matrix ratios, which the sweep overwrites anyway
+    input_tuple = frozen_inputs[:2] + (0.0, 0.0) + frozen_inputs[2:]
+    
+    # Repeat the frozen inputs and vary only the filler/matrix ratios
+    rows = np.repeat(_encode_row(input_tuple), n_points, axis=0)
+    rows[:, feature_names.index('Filler_Ratio_wt%')] = ratios
+    rows[:, feature_names.index('Matrix_Ratio_wt%')] = 100.0 - ratios
+    
+    return ratios, _predict_rows(rows)
+
+@st.cache_data
+def _load_feature_importance(backend):
+    """Stack the per-target feature importances of the active backend into a single matrix"""
+    if backend == 'lightgbm':
+        # Split gain, normalized per target like the forest's impurity importances
+        gains = np.stack([
+            booster.feature_importance(importance_type='gain')
+            for booster in _load_lightgbm_boosters()
+        ])
+        totals = gains.sum(axis=1, keepdims=True)
+        return gains / np.where(totals == 0, 1, totals)
+    
+    model = _load_model_bundle()['model']
+    return np.stack([estimator.feature_importances_ for estimator in model.estimators_])
+
 class PolymerCompositeApp:
     def __init__(self):
         self.model = None
         self.scaler = None
         self.label_encoders = {}
+        self.encoder_maps = {}
+        self.backend = None
         self.feature_names = None
         self.target_names = None
         self.load_model()
@@ -88,63 +316,240 @@ class PolymerCompositeApp:
     def load_model(self):
         """Load the trained model and preprocessors"""
         try:
-            model_data = joblib.load('polymer_composite_model.pkl')
-            self.model = model_data['model']
+            model_data = _load_model_bundle()
+            encoder_maps = _load_encoder_maps()
             self.scaler = model_data['scaler']
             self.label_encoders = model_data['label_encoders']
+            self.encoder_maps = encoder_maps
             self.feature_names = model_data['feature_names']
             self.target_names = model_data['target_names']
-            return True
+            # Set last: a partial load leaves model None so main() retries it
+            self.model = model_data['model']
         except FileNotFoundError:
             st.error("Model file not found. Please train the model first.")
             return False
         except Exception as e:
             st.error(f"Error loading model: {str(e)}")
             return False
-    
-    def predict(self, input_data):
-        """Make predictions on input data"""
-        if self.model is None:
+        
+        # Resolve the backend last; the optional backends fall back to the forest rather than raise
+        self.backend = _active_backend()
+        return True
+    
+    def validate_inputs(self, input_tuple):
+        """Check categorical inputs against the fitted encoders"""
+        # Dict lookups replace LabelEncoder.transform, so check for unseen categories up front
+        for feature, value in zip(self.feature_names, input_tuple):
+            if feature in self.encoder_maps and value not in self.encoder_maps[feature]:
+                st.error(f"Unknown {feature.replace('_', ' ')}: {value}")
+                return False
+        return True
+    
+    def predict(self, input_tuple):
+        """Make predictions for a tuple of raw input parameters"""
+        if self.model is None or not self.validate_inputs(input_tuple):
             return None
         
         try:
-            # Scale the input data
-            input_scaled = self.scaler.transform(input_data)
-            
-            # Make prediction
-            predictions = self.model.predict(input_scaled)
-            
-            # Convert back to DataFrame
-            predictions_df = pd.DataFrame(predictions, columns=self.target_names)
-            
-            # Convert electrical resistivity back from log scale
-            predictions_df['Electrical_Resistivity_Ohm_m'] = 10 ** predictions_df['Electrical_Resistivity_Ohm_m']
-            
-            return predictions_df
+            return _cached_predict(input_tuple)
         except Exception as e:
             st.error(f"Error making prediction: {str(e)}")
             return None
     
+    def sweep_filler_ratio(self, input_tuple):
+        """Predict properties across the filler ratio range for fixed other inputs"""
+        if self.model is None or not self.validate_inputs(input_tuple):
+            return None
+        
+        try:
+            # Drop the filler/matrix ratios (positions 2 and 3) from the cache key
+            return _cached_sweep(input_tuple[:2] + input_tuple[4:])
+        except Exception as e:
+            st.error(f"Error running sensitivity sweep: {str(e)}")
+            return None
+    
     def get_feature_importance(self):
-        """Get feature importance for visualization"""
+        """Get the (targets x features) importance matrix for visualization"""
         if self.model is None:
             return None
         
-        importance_dict = {}
-        for i, target in enumerate(self.target_names):
-            importance_dict[target] = dict(zip(
-                self.feature_names, 
-                self.model.estimators_[i].feature_importances_
-            ))
-        
-        return importance_dict
+        return _load_feature_importance(self.backend)
+
+@st.cache_data(max_entries=512)
+def _results_csv(pred_tuple):
+    """Serialize the results summary to CSV bytes without going through pandas"""
+    lines = ["Property,Value,Unit"]
+    lines += [
+        f"{name},{value:{fmt}},{unit}"
+        for (name, _, fmt, unit), value in zip(RESULT_ROWS, pred_tuple)
+    ]
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+@st.cache_resource
+def get_app():
+    """Build the app once per process and share it across reruns and sessions"""
+    return PolymerCompositeApp()
+
+def _gauge(value, axis_max, color, steps, threshold):
+    """Build a gauge indicator trace for a predicted property"""
+    import plotly.graph_objects as go
+    
+    return go.Indicator(
+        mode="gauge+number",
+        value=value,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={'axis': {'range': [None, axis_max]},
+               'bar': {'color': color},
+               'steps': [{'range': [0, steps[0]], 'color': "lightgray"},
+                         {'range': [steps[0], steps[1]], 'color': "gray"}],
+               'threshold': {'line': {'color': "red", 'width': 4},
+                             'thickness': 0.75, 'value': threshold}}
+    )
+
+def _build_figs(pred):
+    """Build the property charts for a prediction so reruns can reuse them"""
+    # Plotly is imported lazily so pages that don't plot skip its import cost
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    # Gauge charts for mechanical properties
+    fig_mech = make_subplots(
+        rows=1, cols=len(MECHANICAL_GAUGES),
+        specs=[[{"type": "indicator"}] * len(MECHANICAL_GAUGES)],
+        subplot_titles=[spec[0] for spec in MECHANICAL_GAUGES]
+    )
+    
+    for i, (_, key, axis_max, color, steps, threshold) in enumerate(MECHANICAL_GAUGES):
+        fig_mech.add_trace(_gauge(pred[key], axis_max, color, steps, threshold), row=1, col=i + 1)
+    
+    fig_mech.update_layout(height=300)
+    
+    # Bar chart for thermal properties
+    thermal_data = {
+        'Property': ['Thermal Conductivity', 'Glass Transition Temp', 'Thermal Expansion'],
+        'Value': [pred['Thermal_Conductivity_W_mK'], pred['Glass_Transition_Temp_C'], pred['Thermal_Expansion_ppm_C']],
+        'Unit': ['W/m·K', '°C', 'ppm/°C']
+    }
+    
+    fig_therm = go.Figure(data=[
+        go.Bar(x=thermal_data['Property'], y=thermal_data['Value'], 
+               marker_color=['#1f77b4', '#ff7f0e', '#2ca02c'])
+    ])
+    fig_therm.update_layout(title="Thermal Properties", yaxis_title="Value")
+    
+    # Electrical properties visualization
+    fig_elec = make_subplots(
+        rows=2, cols=2,
+        specs=[[{"type": "indicator"}, {"type": "indicator"}],
+               [{"colspan": 2}, None]],
+        subplot_titles=["Dielectric Constant", "Dielectric Strength", "Electrical Resistivity"]
+    )
+    
+    for i, (_, key, axis_max, color, steps, threshold) in enumerate(ELECTRICAL_GAUGES):
+        fig_elec.add_trace(_gauge(pred[key], axis_max, color, steps, threshold), row=1, col=i + 1)
+    
+    # Log scale bar for electrical resistivity
+    fig_elec.add_trace(go.Bar(
+        x=['Electrical Resistivity'],
+        y=[np.log10(pred['Electrical_Resistivity_Ohm_m'])],
+        marker_color='#8c564b',
+        name='log10(Resistivity)'
+    ), row=2, col=1)
+    
+    fig_elec.update_layout(height=500, showlegend=False)
+    
+    return {'mech': fig_mech, 'therm': fig_therm, 'elec': fig_elec}
+
+def _build_sweep_fig(ratios, predictions, target_names, selected_property):
+    """Plot one predicted property against the filler ratio"""
+    import plotly.graph_objects as go
+    
+    label = TARGET_LABELS.get(selected_property, selected_property)
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=ratios,
+            y=predictions[:, target_names.index(selected_property)],
+            mode='lines',
+            line={'color': '#1f77b4'}
+        )
+    ])
+    fig.update_layout(
+        title=f"{label} vs. Filler Ratio",
+        xaxis_title="Filler Ratio (wt%)",
+        yaxis_title=label,
+        yaxis_type='log' if selected_property == 'Electrical_Resistivity_Ohm_m' else 'linear',
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data
+def _importance_table(selected_property, backend):
+    """Feature importances for one property, sorted from most to least important"""
+    model_data = _load_model_bundle()
+    importances = _load_feature_importance(backend)[model_data['target_names'].index(selected_property)]
+    order = np.argsort(importances)[::-1]
+    
+    return pd.DataFrame({
+        'Feature': [model_data['feature_names'][i] for i in order],
+        'Importance': importances[order]
+    })
+
+@st.cache_data
+def _model_info_table(backend):
+    """Table of model hyperparameters for the active backend"""
+    if backend == 'lightgbm':
+        boosters = _load_lightgbm_boosters()
+        model_info = {
+            'Model Type': BACKEND_LABELS[backend],
+            'Number of Boosters': str(len(boosters)),
+            'Trees per Booster': str(boosters[0].num_trees()),
+            'Feature Importance': 'Normalized split gain',
+        }
+    else:
+        model_info = {
+            'Model Type': BACKEND_LABELS[backend],
+            'Number of Estimators': '100',
+            'Max Depth': '15',
+            'Min Samples Split': '5',
+            'Min Samples Leaf': '2',
+        }
+    
+    model_info.update({
+        'Training Dataset Size': '500 samples',
+        'Number of Features': '9',
+        'Number of Target Properties': '9'
+    })
+    
+    return pd.DataFrame(list(model_info.items()), columns=['Parameter', 'Value'])
+
+@st.cache_data
+def _dataset_stats_table():
+    """Static table of dataset statistics"""
+    stats_data = {
+        'Parameter': [
+            'Total Samples', 'Polymer Matrix Types', 'Filler Types', 'Input Features', 
+            'Output Properties', 'Filler Ratio Range', 'Temperature Range', 'Pressure Range'
+        ],
+        'Value': [
+            '500', '5', '10', '9', '9', '0-50 wt%', '60-180 °C', '0.1-10 MPa'
+        ]
+    }
+    
+    return pd.DataFrame(stats_data)
 
 def main():
+    # Apply custom styles before any other element
+    inject_css()
+    
     # Add company logo at the top
     add_logo()
     
     # Initialize app
-    app = PolymerCompositeApp()
+    app = get_app()
+    if app.model is None:
+        # Don't keep a failed load around; retry on the next rerun
+        get_app.clear()
     
     # Main header
     st.markdown('<h1 class="main-header">🧪 AI-Powered Polymer Composite Properties Predictor</h1>', unsafe_allow_html=True)
@@ -156,7 +561,7 @@ def main():
     if page == "Predictor":
         predictor_page(app)
     elif page == "About":
-        about_page()
+        about_page(app)
     elif page == "Model Performance":
         model_performance_page(app)
     elif page == "Dataset Info":
@@ -170,62 +575,51 @@ def predictor_page(app):
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        st.markdown("### Input Parameters")
-        
-        # Material selection
-        polymer_matrices = ['Epoxy', 'Polyester', 'Vinyl Ester', 'Phenolic', 'Polyurethane']
-        filler_types = ['Bovine Bone Particles', 'Hydroxyapatite', 'Bamboo Fibers', 
-                       'Wood Flour', 'Rice Husk', 'Coconut Coir', 'Jute Fibers',
-                       'Flax Fibers', 'Hemp Fibers', 'Chitosan Particles']
-        
-        polymer_matrix = st.selectbox("Polymer Matrix", polymer_matrices)
-        filler_type = st.selectbox("Filler Type", filler_types)
-        
-        # Composition parameters
-        filler_ratio = st.slider("Filler Ratio (wt%)", 0.0, 50.0, 25.0, 0.1)
-        matrix_ratio = 100.0 - filler_ratio
-        
-        st.write(f"Matrix Ratio: {matrix_ratio:.1f} wt%")
-        
-        # Processing parameters
-        curing_temp = st.slider("Curing Temperature (°C)", 60.0, 180.0, 120.0, 1.0)
-        curing_time = st.slider("Curing Time (hours)", 2.0, 24.0, 8.0, 0.5)
-        pressure = st.slider("Pressure (MPa)", 0.1, 10.0, 2.0, 0.1)
-        particle_size = st.slider("Particle Size (μm)", 10.0, 500.0, 100.0, 1.0)
-        density = st.slider("Density (g/cm³)", 1.0, 2.5, 1.5, 0.01)
-        
-        # Create input DataFrame
-        input_data = pd.DataFrame({
-            'Polymer_Matrix': [polymer_matrix],
-            'Filler_Type': [filler_type],
-            'Filler_Ratio_wt%': [filler_ratio],
-            'Matrix_Ratio_wt%': [matrix_ratio],
-            'Curing_Temperature_C': [curing_temp],
-            'Curing_Time_hours': [curing_time],
-            'Pressure_MPa': [pressure],
-            'Particle_Size_microns': [particle_size],
-            'Density_g_cm3': [density]
-        })
-        
-        # Encode categorical variables
-        for feature in ['Polymer_Matrix', 'Filler_Type']:
-            if feature in app.label_encoders:
-                input_data[feature] = app.label_encoders[feature].transform(input_data[feature])
+        # Inputs live in a form so slider changes only rerun the app on submit
+        with st.form("inputs"):
+            st.markdown("### Input Parameters")
+            
+            # Material selection
+            polymer_matrix = st.selectbox("Polymer Matrix", POLYMER_MATRICES)
+            filler_type = st.selectbox("Filler Type", FILLER_TYPES)
+            
+            # Composition parameters
+            filler_ratio = st.slider("Filler Ratio (wt%)", 0.0, 50.0, 25.0, 0.1)
+            matrix_ratio = 100.0 - filler_ratio
+            
+            st.caption("Matrix ratio = 100 − filler ratio")
+            
+            # Processing parameters
+            curing_temp = st.slider("Curing Temperature (°C)", 60.0, 180.0, 120.0, 1.0)
+            curing_time = st.slider("Curing Time (hours)", 2.0, 24.0, 8.0, 0.5)
+            pressure = st.slider("Pressure (MPa)", 0.1, 10.0, 2.0, 0.1)
+            particle_size = st.slider("Particle Size (μm)", 10.0, 500.0, 100.0, 1.0)
+            density = st.slider("Density (g/cm³)", 1.0, 2.5, 1.5, 0.01)
+            
+            # Raw input parameters, in model feature order
+            input_tuple = (polymer_matrix, filler_type, filler_ratio, matrix_ratio,
+                           curing_temp, curing_time, pressure, particle_size, density)
+            
+            # Predict button
+            submitted = st.form_submit_button("🔬 Predict Properties", type="primary")
         
-        # Predict button
-        if st.button("🔬 Predict Properties", type="primary"):
-            with st.spinner("Predicting properties..."):
-                predictions = app.predict(input_data)
+        if submitted:
+            with st.status("Predicting properties...") as status:
+                predictions = app.predict(input_tuple)
                 
                 if predictions is not None:
                     st.session_state.predictions = predictions
-                    st.success("Prediction completed!")
+                    st.session_state.figs = _build_figs(predictions)
+                    status.update(label="Prediction completed!", state="complete", expanded=False)
+                else:
+                    status.update(label="Prediction failed", state="error")
     
     with col2:
         st.markdown("### Predicted Properties")
         
         if 'predictions' in st.session_state:
-            pred = st.session_state.predictions.iloc[0]
+            pred = st.session_state.predictions
+            figs = st.session_state.figs
             
             # Create tabs for different property categories
             mech_tab, therm_tab, elec_tab = st.tabs(["Mechanical", "Thermal", "Electrical"])
@@ -245,51 +639,7 @@ def predictor_page(app):
                 with col_mech3:
                     st.metric("Impact Strength", f"{pred['Impact_Strength_J_m']:.2f} J/m")
                 
-                # Create gauge charts for mechanical properties
-                fig_mech = make_subplots(
-                    rows=1, cols=3,
-                    specs=[[{"type": "indicator"}, {"type": "indicator"}, {"type": "indicator"}]],
-                    subplot_titles=["Tensile Strength", "Flexural Strength", "Impact Strength"]
-                )
-                
-                fig_mech.add_trace(go.Indicator(
-                    mode="gauge+number",
-                    value=pred['Tensile_Strength_MPa'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={'axis': {'range': [None, 200]},
-                           'bar': {'color': "#1f77b4"},
-                           'steps': [{'range': [0, 50], 'color': "lightgray"},
-                                   {'range': [50, 100], 'color': "gray"}],
-                           'threshold': {'line': {'color': "red", 'width': 4},
-                                       'thickness': 0.75, 'value': 150}}
-                ), row=1, col=1)
-                
-                fig_mech.add_trace(go.Indicator(
-                    mode="gauge+number",
-                    value=pred['Flexural_Strength_MPa'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={'axis': {'range': [None, 250]},
-                           'bar': {'color': "#ff7f0e"},
-                           'steps': [{'range': [0, 75], 'color': "lightgray"},
-                                   {'range': [75, 150], 'color': "gray"}],
-                           'threshold': {'line': {'color': "red", 'width': 4},
-                                       'thickness': 0.75, 'value': 200}}
-                ), row=1, col=2)
-                
-                fig_mech.add_trace(go.Indicator(
-                    mode="gauge+number",
-                    value=pred['Impact_Strength_J_m'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={'axis': {'range': [None, 50]},
-                           'bar': {'color': "#2ca02c"},
-                           'steps': [{'range': [0, 15], 'color': "lightgray"},
-                                   {'range': [15, 30], 'color': "gray"}],
-                           'threshold': {'line': {'color': "red", 'width': 4},
-                                       'thickness': 0.75, 'value': 40}}
-                ), row=1, col=3)
-                
-                fig_mech.update_layout(height=300)
-                st.plotly_chart(fig_mech, use_container_width=True)
+                st.plotly_chart(figs['mech'], use_container_width=True)
             
             with therm_tab:
                 st.markdown("#### Thermal Properties")
@@ -305,19 +655,7 @@ def predictor_page(app):
                 with col_therm3:
                     st.metric("Thermal Expansion", f"{pred['Thermal_Expansion_ppm_C']:.1f} ppm/°C")
                 
-                # Bar chart for thermal properties
-                thermal_data = {
-                    'Property': ['Thermal Conductivity', 'Glass Transition Temp', 'Thermal Expansion'],
-                    'Value': [pred['Thermal_Conductivity_W_mK'], pred['Glass_Transition_Temp_C'], pred['Thermal_Expansion_ppm_C']],
-                    'Unit': ['W/m·K', '°C', 'ppm/°C']
-                }
-                
-                fig_therm = go.Figure(data=[
-                    go.Bar(x=thermal_data['Property'], y=thermal_data['Value'], 
-                           marker_color=['#1f77b4', '#ff7f0e', '#2ca02c'])
-                ])
-                fig_therm.update_layout(title="Thermal Properties", yaxis_title="Value")
-                st.plotly_chart(fig_therm, use_container_width=True)
+                st.plotly_chart(figs['therm'], use_container_width=True)
             
             with elec_tab:
                 st.markdown("#### Electrical Properties")
@@ -331,88 +669,51 @@ def predictor_page(app):
                 with col_elec2:
                     st.metric("Dielectric Strength", f"{pred['Dielectric_Strength_kV_mm']:.2f} kV/mm")
                 
-                # Electrical properties visualization
-                fig_elec = make_subplots(
-                    rows=2, cols=2,
-                    specs=[[{"type": "indicator"}, {"type": "indicator"}],
-                           [{"colspan": 2}, None]],
-                    subplot_titles=["Dielectric Constant", "Dielectric Strength", "Electrical Resistivity"]
-                )
-                
-                fig_elec.add_trace(go.Indicator(
-                    mode="gauge+number",
-                    value=pred['Dielectric_Constant'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={'axis': {'range': [None, 10]},
-                           'bar': {'color': "#d62728"},
-                           'steps': [{'range': [0, 4], 'color': "lightgray"},
-                                   {'range': [4, 6], 'color': "gray"}],
-                           'threshold': {'line': {'color': "red", 'width': 4},
-                                       'thickness': 0.75, 'value': 8}}
-                ), row=1, col=1)
-                
-                fig_elec.add_trace(go.Indicator(
-                    mode="gauge+number",
-                    value=pred['Dielectric_Strength_kV_mm'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={'axis': {'range': [None, 60]},
-                           'bar': {'color': "#9467bd"},
-                           'steps': [{'range': [0, 20], 'color': "lightgray"},
-                                   {'range': [20, 40], 'color': "gray"}],
-                           'threshold': {'line': {'color': "red", 'width': 4},
-                                       'thickness': 0.75, 'value': 50}}
-                ), row=1, col=2)
-                
-                # Log scale bar for electrical resistivity
-                fig_elec.add_trace(go.Bar(
-                    x=['Electrical Resistivity'],
-                    y=[np.log10(pred['Electrical_Resistivity_Ohm_m'])],
-                    marker_color='#8c564b',
-                    name='log10(Resistivity)'
-                ), row=2, col=1)
-                
-                fig_elec.update_layout(height=500, showlegend=False)
-                st.plotly_chart(fig_elec, use_container_width=True)
+                st.plotly_chart(figs['elec'], use_container_width=True)
             
             # Summary table
             st.markdown("### Complete Results Summary")
             
+            pred_tuple = tuple(pred[key] for _, key, _, _ in RESULT_ROWS)
+            
             results_df = pd.DataFrame({
-                'Property': [
-                    'Tensile Strength', 'Flexural Strength', 'Impact Strength',
-                    'Thermal Conductivity', 'Glass Transition Temperature', 'Thermal Expansion',
-                    'Electrical Resistivity', 'Dielectric Constant', 'Dielectric Strength'
-                ],
-                'Value': [
-                    f"{pred['Tensile_Strength_MPa']:.2f}",
-                    f"{pred['Flexural_Strength_MPa']:.2f}",
-                    f"{pred['Impact_Strength_J_m']:.2f}",
-                    f"{pred['Thermal_Conductivity_W_mK']:.3f}",
-                    f"{pred['Glass_Transition_Temp_C']:.1f}",
-                    f"{pred['Thermal_Expansion_ppm_C']:.1f}",
-                    f"{pred['Electrical_Resistivity_Ohm_m']:.2e}",
-                    f"{pred['Dielectric_Constant']:.2f}",
-                    f"{pred['Dielectric_Strength_kV_mm']:.2f}"
-                ],
-                'Unit': [
-                    'MPa', 'MPa', 'J/m', 'W/m·K', '°C', 'ppm/°C', 'Ω·m', '-', 'kV/mm'
-                ]
+                'Property': [name for name, _, _, _ in RESULT_ROWS],
+                'Value': [f"{value:{fmt}}" for (_, _, fmt, _), value in zip(RESULT_ROWS, pred_tuple)],
+                'Unit': [unit for _, _, _, unit in RESULT_ROWS]
             })
             
             st.dataframe(results_df, use_container_width=True)
             
             # Download results
-            csv = results_df.to_csv(index=False)
             st.download_button(
                 label="📥 Download Results as CSV",
-                data=csv,
+                data=_results_csv(pred_tuple),
                 file_name="polymer_composite_prediction.csv",
                 mime="text/csv"
             )
         else:
             st.info("👆 Please input parameters and click 'Predict Properties' to see results.")
+    
+    # Sensitivity sweep over the filler ratio for the current inputs
+    if app.model is not None:
+        st.markdown("### 📈 Sensitivity Sweep")
+        
+        if st.checkbox("Show property vs. filler ratio for the current inputs"):
+            selected_property = st.selectbox(
+                "Property to sweep",
+                app.target_names,
+                format_func=lambda key: TARGET_LABELS.get(key, key)
+            )
+            sweep = app.sweep_filler_ratio(input_tuple)
+            
+            if sweep is not None:
+                ratios, sweep_predictions = sweep
+                st.plotly_chart(
+                    _build_sweep_fig(ratios, sweep_predictions, app.target_names, selected_property),
+                    use_container_width=True
+                )
 
-def about_page():
+def about_page(app):
     """About page with project information"""
     st.markdown('<h2 class="sub-header">About This Application</h2>', unsafe_allow_html=True)
     
@@ -426,28 +727,7 @@ def about_page():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        ### 🧪 Supported Materials
-        
-        **Polymer Matrices:**
-        - Epoxy
-        - Polyester
-        - Vinyl Ester
-        - Phenolic
-        - Polyurethane
-        
-        **Natural Biogenic Fillers:**
-        - Bovine Bone Particles
-        - Hydroxyapatite
-        - Bamboo Fibers
-        - Wood Flour
-        - Rice Husk
-        - Coconut Coir
-        - Jute Fibers
-        - Flax Fibers
-        - Hemp Fibers
-        - Chitosan Particles
-        """)
+        st.markdown(SUPPORTED_MATERIALS_MD)
     
     with col2:
         st.markdown("""
@@ -469,10 +749,12 @@ def about_page():
         - Dielectric Strength (kV/mm)
         """)
     
-    st.markdown("""
+    model_label = BACKEND_LABELS.get(app.backend, BACKEND_LABELS['sklearn'])
+    
+    st.markdown(f"""
     ### 🤖 Machine Learning Model
     
-    The application uses a **Multi-Output Random Forest Regressor** trained on a synthetic dataset of 500 samples. The model:
+    The application uses a **{model_label}** trained on a synthetic dataset of 500 samples. The model:
     
     - Handles multiple input features including material composition, processing parameters, and physical properties
     - Simultaneously predicts 9 different material properties
@@ -490,32 +772,29 @@ def about_page():
 
 def model_performance_page(app):
     """Model performance and feature importance page"""
+    import plotly.graph_objects as go
+    
     st.markdown('<h2 class="sub-header">Model Performance Analysis</h2>', unsafe_allow_html=True)
     
     # Feature importance
-    importance_data = app.get_feature_importance()
+    importance_matrix = app.get_feature_importance()
     
-    if importance_data:
+    if importance_matrix is not None:
         st.markdown("### 📊 Feature Importance Analysis")
         
         # Select property for feature importance display
         selected_property = st.selectbox(
             "Select property to view feature importance:",
-            list(importance_data.keys())
+            app.target_names
         )
         
-        # Create feature importance plot
-        features = list(importance_data[selected_property].keys())
-        importances = list(importance_data[selected_property].values())
-        
-        # Sort by importance
-        sorted_data = sorted(zip(features, importances), key=lambda x: x[1], reverse=True)
-        sorted_features, sorted_importances = zip(*sorted_data)
+        # Sorted feature importance table
+        importance_df = _importance_table(selected_property, app.backend)
         
         fig = go.Figure(data=[
             go.Bar(
-                y=sorted_features,
-                x=sorted_importances,
+                y=importance_df['Feature'],
+                x=importance_df['Importance'],
                 orientation='h',
                 marker_color='#1f77b4'
             )
@@ -530,29 +809,15 @@ def model_performance_page(app):
         
         st.plotly_chart(fig, use_container_width=True)
         
-        # Feature importance table
-        importance_df = pd.DataFrame({
-            'Feature': sorted_features,
-            'Importance': sorted_importances
-        })
-        
         st.dataframe(importance_df, use_container_width=True)
     
     # Model information
     st.markdown("### 🔧 Model Details")
     
-    model_info = {
-        'Model Type': 'Multi-Output Random Forest Regressor',
-        'Number of Estimators': '100',
-        'Max Depth': '15',
-        'Min Samples Split': '5',
-        'Min Samples Leaf': '2',
-        'Training Dataset Size': '500 samples',
-        'Number of Features': '9',
-        'Number of Target Properties': '9'
-    }
+    if app.backend is not None:
+        st.info(f"Active inference backend: {BACKEND_LABELS[app.backend]}")
     
-    info_df = pd.DataFrame(list(model_info.items()), columns=['Parameter', 'Value'])
+    info_df = _model_info_table(app.backend or 'sklearn')
     st.dataframe(info_df, use_container_width=True)
 
 def dataset_info_page():
@@ -577,17 +842,7 @@ def dataset_info_page():
     """)
     
     # Dataset statistics
-    stats_data = {
-        'Parameter': [
-            'Total Samples', 'Polymer Matrix Types', 'Filler Types', 'Input Features', 
-            'Output Properties', 'Filler Ratio Range', 'Temperature Range', 'Pressure Range'
-        ],
-        'Value': [
-            '500', '5', '10', '9', '9', '0-50 wt%', '60-180 °C', '0.1-10 MPa'
-        ]
-    }
-    
-    stats_df = pd.DataFrame(stats_data)
+    stats_df = _dataset_stats_table()
     st.dataframe(stats_df, use_container_width=True)
     
     st.markdown("""
@@ -0,0 +1,100 @@
+import os
+import joblib
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from model_fingerprint import LIGHTGBM_FINGERPRINT_FILE, file_sha256
+
+MODEL_PATH = 'polymer_composite_model.pkl'
+DATASET_PATH = 'polymer_composite_dataset.csv'
+LIGHTGBM_DIR = 'lightgbm_models'
+
+# Regularized for ~400 noisy training rows: shallow trees, large leaves, early stopping
+LIGHTGBM_PARAMS = {
+    'n_estimators': 1000,
+    'learning_rate': 0.03,
+    'num_leaves': 7,
+    'min_child_samples': 30,
+    'subsample': 0.8,
+    'subsample_freq': 1,
+    'colsample_bytree': 0.8,
+    'reg_lambda': 1.0,
+    'random_state': 42,
+    'verbose': -1
+}
+EARLY_STOPPING_ROUNDS = 50
+
+def load_training_data(model_data):
+    """Encode, scale and log-transform the dataset with the app's preprocessors"""
+    data = pd.read_csv(DATASET_PATH)
+    
+    # Encode categorical variables with the fitted label encoders
+    for feature, encoder in model_data['label_encoders'].items():
+        data[feature] = encoder.transform(data[feature])
+    
+    # Scale in float64 and cast afterwards, exactly as the app does at inference time
+    scaler = model_data['scaler']
+    X = data[model_data['feature_names']].to_numpy(dtype=np.float64)
+    X = ((X - scaler.mean_) / scaler.scale_).astype(np.float32)
+    
+    # Electrical resistivity is modelled in log scale
+    y = data[model_data['target_names']].copy()
+    y['Electrical_Resistivity_Ohm_m'] = np.log10(y['Electrical_Resistivity_Ohm_m'])
+    
+    return X, y
+
+def train_lightgbm():
+    """Train one LightGBM booster per target property and save it in native text format"""
+    model_data = joblib.load(MODEL_PATH)
+    X, y = load_training_data(model_data)
+    
+    # Same split as the Random Forest training in the notebook
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+    
+    # Hold out part of the training data to pick the number of boosting rounds
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, y_train, test_size=0.2, random_state=42
+    )
+    
+    # Reference scores of the shipped forest on the same test split
+    forest_pred = model_data['model'].predict(X_test)
+    
+    boosters = {}
+    worse_targets = []
+    for i, target in enumerate(model_data['target_names']):
+        model = lgb.LGBMRegressor(**LIGHTGBM_PARAMS)
+        model.fit(
+            X_fit, y_fit[target],
+            eval_set=[(X_val, y_val[target])],
+            callbacks=[lgb.early_stopping(EARLY_STOPPING_ROUNDS, verbose=False)]
+        )
+        
+        r2 = r2_score(y_test[target], model.predict(X_test))
+        forest_r2 = r2_score(y_test[target], forest_pred[:, i])
+        print(f"{target}: test R2 = {r2:.3f} (forest {forest_r2:.3f}, {model.best_iteration_} rounds)")
+        
+        if r2 < forest_r2:
+            worse_targets.append(target)
+        boosters[target] = model.booster_
+    
+    # Boosters are all-or-nothing in the app, so refuse to save any that lose to the forest
+    if worse_targets:
+        print(f"Not saving LightGBM boosters: worse than the forest on {', '.join(worse_targets)}")
+        raise SystemExit(1)
+    
+    os.makedirs(LIGHTGBM_DIR, exist_ok=True)
+    for target, booster in boosters.items():
+        booster.save_model(os.path.join(LIGHTGBM_DIR, f'{target}.txt'))
+    
+    # Record the source pickle so the app can ignore stale boosters
+    with open(os.path.join(LIGHTGBM_DIR, LIGHTGBM_FINGERPRINT_FILE), 'w') as f:
+        f.write(file_sha256(MODEL_PATH))
+    
+    print(f"Saved LightGBM boosters to {LIGHTGBM_DIR}/")
+
+if __name__ == "__main__":
+    train_lightgbm()